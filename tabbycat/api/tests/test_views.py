@@ -1,9 +1,12 @@
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 from dynamic_preferences.registries import global_preferences_registry
 from rest_framework.test import APITestCase
 
 from breakqual.models import BreakingTeam
+from draw.models import Debate
+from results.utils import get_result_status_stats
 from utils.tests import CompletedTournamentTestMixin
 
 
@@ -140,3 +143,29 @@ class BreakingTeamsViewsetTests(CompletedTournamentTestMixin, APITestCase):
             'remark': BreakingTeam.Remark.WITHDRAWN,
         }, content_type='application/json')
         self.assertEqual(len(response.data), 16)
+
+
+class PairingViewsetTests(CompletedTournamentTestMixin, APITestCase):
+
+    round_seq = 4
+
+    def setUp(self):
+        super().setUp()
+        self.client.login(username="admin", password="admin")
+        # Leave one debate without a result, bypassing signals
+        self.debate = self.round.debate_set.first()
+        Debate.objects.filter(id=self.debate.id).update(result_status=Debate.STATUS_NONE)
+        cache.clear()
+        self.assertEqual(get_result_status_stats(self.round)[Debate.STATUS_NONE], 1)
+
+    def test_delete_pairing_clears_result_status_stats(self):
+        response = self.client.delete(reverse('api-pairing-detail', kwargs={
+            'tournament_slug': self.tournament.slug, 'round_seq': self.round.seq, 'debate_pk': self.debate.pk}))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(get_result_status_stats(self.round)[Debate.STATUS_NONE], 0)
+
+    def test_delete_all_pairings_clears_result_status_stats(self):
+        response = self.client.delete(reverse('api-pairing-list', kwargs={
+            'tournament_slug': self.tournament.slug, 'round_seq': self.round.seq}))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(sum(get_result_status_stats(self.round).values()), 0)
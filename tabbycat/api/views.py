@@ -628,8 +628,8 @@ class BaseCheckinsView(AdministratorAPIMixin, TournamentAPIMixin, APIView):
         """Get checkin status"""
         obj = self.get_object()
 
-        event = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(identifier=obj.checkin_identifier)
-        return Response(self.get_response_dict(request, obj, event.exists(), event.first()))
+        event = get_unexpired_checkins(self.tournament, self.window_preference_pref).filter(identifier=obj.checkin_identifier).first()
+        return Response(self.get_response_dict(request, obj, event is not None, event))
 
     @extend_schema(request=None, responses={200: serializers.CheckinSerializer})
     def delete(self, request, *args, **kwargs):
@@ -52,7 +52,7 @@ def create_identifiers(model_to_make, items_to_check):
     return
 
 
-def single_checkin(instance, events):
+def single_checkin(instance, times_by_barcode):
     instance.checked_icon = ''
     instance.checked_in = False
     try:
@@ -65,7 +65,7 @@ def single_checkin(instance, events):
         instance.checked_tooltip = _("Not checked in; no barcode assigned")
 
     if identifier:
-        instance.time = next((e['time'] for e in events if e['identifier__barcode'] == identifier.barcode), None)
+        instance.time = times_by_barcode.get(identifier.barcode)
         if instance.time:
             instance.checked_in = True
             instance.checked_icon = 'check'
@@ -73,13 +73,13 @@ def single_checkin(instance, events):
     return instance
 
 
-def multi_checkin(team, events, t):
+def multi_checkin(team, times_by_barcode, t):
     team.checked_icon = ''
     team.checked_in = False
     tooltips = []
 
     for speaker in team.speaker_set.all():
-        speaker = single_checkin(speaker, events)
+        speaker = single_checkin(speaker, times_by_barcode)
         if speaker.checked_in:
             tooltip = _("%(speaker)s checked in at %(time)s.") % {'speaker': speaker.get_public_name(t), 'time': speaker.time.strftime('%H:%M')}
         else:
@@ -101,12 +101,19 @@ def multi_checkin(team, events, t):
 
 
 def get_checkins(queryset, t, window_preference_type):
-    events = get_unexpired_checkins(t, window_preference_type).values(
-        'time', 'identifier__barcode')
+    events = get_unexpired_checkins(t, window_preference_type).values_list(
+        'identifier__barcode', 'time')
+
+    # Index the events by barcode once, rather than scanning them all for every
+    # instance. They're ordered by time, so keep the first for each barcode.
+    times_by_barcode = {}
+    for barcode, time in events:
+        times_by_barcode.setdefault(barcode, time)
+
     for instance in queryset:
         if hasattr(instance, 'use_institution_prefix'):
-            instance = multi_checkin(instance, events, t)
+            instance = multi_checkin(instance, times_by_barcode, t)
         else:
-            instance = single_checkin(instance, events)
+            instance = single_checkin(instance, times_by_barcode)
 
     return queryset
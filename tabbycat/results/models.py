@@ -13,7 +13,7 @@ from utils.misc import badge_datetime_format, reverse_tournament
 from utils.models import UniqueConstraint
 
 from .result import DebateResult
-from .utils import readable_ballotsub_result
+from .utils import readable_ballotsub_result, readable_teamscores_result
 
 logger = logging.getLogger(__name__)
 
@@ -149,12 +149,17 @@ class BallotSubmission(Submission):
 
     @property
     def serialize_like_actionlog(self):
-        if hasattr(self, '_result'):
-            dr = self._result
-        else:
-            from results.result import DebateResult
-            dr = DebateResult(self)
-        result_winner, result = readable_ballotsub_result(dr)
+        readable = None
+        if not hasattr(self, '_result') and hasattr(self, '_teamscores'):
+            readable = readable_teamscores_result(self, self.debate.round.tournament)
+        if readable is None:
+            if hasattr(self, '_result'):
+                dr = self._result
+            else:
+                from results.result import DebateResult
+                dr = DebateResult(self)
+            readable = readable_ballotsub_result(dr)
+        result_winner, result = readable
         return {
             'user': result_winner,
             'id': self.id,
@@ -170,10 +175,12 @@ class BallotSubmission(Submission):
         if not tournament:
             tournament = self.debate.round.tournament
 
+        # Convert to the tab's time zone once; both formats below derive from it
+        created_local = timezone.localtime(self.timestamp)
         # Shown in the results page on a per-ballot; always measured in tab TZ
-        created_short = timezone.localtime(self.timestamp).strftime("%H:%M")
+        created_short = created_local.strftime("%H:%M")
         # These are used by the status graph
-        created = timezone.localtime(self.timestamp).isoformat()
+        created = created_local.isoformat()
         confirmed = None
         if self.confirm_timestamp and self.confirmed:
             confirmed = timezone.localtime(self.confirm_timestamp).isoformat()
@@ -195,7 +202,7 @@ class BallotSubmission(Submission):
 
         return {
             'ballot_id': self.id,
-            'debate_id': self.debate.id,
+            'debate_id': self.debate_id,
             'submitter': submitter,
             'private_url': private_url,
             'admin_link': reverse_tournament(admin_url, tournament, kwargs={'pk': self.id}),
@@ -63,8 +63,30 @@ def populate_confirmed_ballots(debates, motions=False, results=False):
     for debate in debates:
         debate._confirmed_ballot = ballotsubs_by_debate_id.get(debate.id, None)
 
-    if results:
-        populate_results(confirmed_ballots)
+    if results and ballotsubs_by_debate_id:
+        # The tournament was already loaded with each ballot's debate, so don't
+        # make populate_results() look it up again.
+        tournament = next(iter(ballotsubs_by_debate_id.values())).debate.round.tournament
+        populate_results(confirmed_ballots, tournament)
+
+
+def populate_teamscores(ballotsubs):
+    """Sets an attribute `_teamscores` on each BallotSubmission in `ballotsubs`
+    to a list of its TeamScores, with their debate teams and teams.
+
+    This is much lighter than `populate_results()`, and is enough for callers
+    that only need to know who won. Operates in-place.
+    """
+    teamscores = TeamScore.objects.filter(
+        ballot_submission__in=ballotsubs,
+    ).select_related('debate_team__team')
+
+    teamscores_by_ballotsub_id = {}
+    for teamscore in teamscores:
+        teamscores_by_ballotsub_id.setdefault(teamscore.ballot_submission_id, []).append(teamscore)
+
+    for ballotsub in ballotsubs:
+        ballotsub._teamscores = teamscores_by_ballotsub_id.get(ballotsub.id, [])
 
 
 def populate_checkins(debates, tournament):
@@ -254,7 +254,8 @@ class BaseDebateResult:
         return self.is_complete()
 
     def identical(self, other):
-        """Returns True of all fields are the same as those in `other`."""
+        """Returns True of all fields are the same as those in `other`.
+        populate_identical_ballotsub_lists() relies on this being transitive."""
         if self.debateteams != other.debateteams:
             return False
         return True
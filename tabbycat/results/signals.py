@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from draw.models import Debate
+from tournaments.models import Round
+
+from .utils import RESULT_STATUS_STATS_CACHE_KEY
+
+
+# Debates are deleted individually and in bulk through the API without the
+# round being saved, so deletions need a receiver too. This doesn't cost the
+# fast-delete path, since debates have cascading relations (debate teams,
+# adjudicators, ballots) and so are always collected instance by instance.
+@receiver(post_delete, sender=Debate)
+@receiver(post_save, sender=Debate)
+def clear_result_status_stats_cache(sender, instance, **kwargs):
+    cache.delete(RESULT_STATUS_STATS_CACHE_KEY % instance.round_id)
+
+
+@receiver(post_save, sender=Round)
+def clear_round_result_status_stats_cache(sender, instance, **kwargs):
+    # Debates in new draws are bulk-created, which doesn't send signals, but
+    # the round is always saved afterwards to update its draw status.
+    cache.delete(RESULT_STATUS_STATS_CACHE_KEY % instance.id)
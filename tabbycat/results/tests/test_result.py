@@ -186,6 +186,22 @@ class BaseTestDebateResult(TestCase):
         self.debate.save()
 
 
+class VotingScoresMixin:
+    """Saves scores from test data in the format of
+    `TestVotingDebateResultWithScores.testdata`, one scoresheet per adjudicator."""
+
+    def save_scores_to_result(self, testdata, result):
+        if result.uses_speakers:
+            for adj, sheet in zip(self.adjs, testdata['input']['scores']):
+                for side, teamscores in zip(self.SIDES, sheet):
+                    for pos, score in enumerate(teamscores, start=1):
+                        result.set_score(adj, side, pos, score)
+
+        if result.uses_declared_winners:
+            for adj, declared_winner in zip(self.adjs, testdata['input']['declared_winners']):
+                result.add_winner(adj, declared_winner)
+
+
 class GeneralSpeakerTestsMixin:
 
     @standard_test
@@ -239,7 +255,7 @@ class GeneralSpeakerTestsMixin:
 # Actual test case classes
 # ==============================================================================
 
-class TestVotingDebateResultWithScores(GeneralSpeakerTestsMixin, BaseTestDebateResult):
+class TestVotingDebateResultWithScores(VotingScoresMixin, GeneralSpeakerTestsMixin, BaseTestDebateResult):
 
     # Currently, the low-allowed and tie-allowed data aren't actually used, but
     # they are in place for future use, for when declared winners get fully
@@ -461,17 +477,6 @@ class TestVotingDebateResultWithScores(GeneralSpeakerTestsMixin, BaseTestDebateR
             'winner_by_adj': [DebateSide.NEG, DebateSide.AFF]},
     }
 
-    def save_scores_to_result(self, testdata, result):
-        if result.uses_speakers:
-            for adj, sheet in zip(self.adjs, testdata['input']['scores']):
-                for side, teamscores in zip(self.SIDES, sheet):
-                    for pos, score in enumerate(teamscores, start=1):
-                        result.set_score(adj, side, pos, score)
-
-        if result.uses_declared_winners:
-            for adj, declared_winner in zip(self.adjs, testdata['input']['declared_winners']):
-                result.add_winner(adj, declared_winner)
-
     # ==========================================================================
     # Normal operation
     # ==========================================================================
@@ -0,0 +1,132 @@
+import logging
+
+from django.core.cache import cache
+
+from availability.utils import activate_all
+from draw.manager import DrawManager
+from draw.models import Debate, DebateTeam
+from draw.types import DebateSide
+from participants.models import Team
+from results.models import BallotSubmission, TeamScore
+from results.prefetch import populate_teamscores
+from results.result import DebateResult, DebateResultByAdjudicatorWithScores
+from results.tests import test_result
+from results.utils import (get_result_status_stats, populate_identical_ballotsub_lists, readable_ballotsub_result,
+                           readable_teamscores_result)
+from tournaments.models import Round
+from utils.tests import BaseMinimalTournamentTestCase, suppress_logs
+
+
+class TestResultStatusStats(BaseMinimalTournamentTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.round = Round.objects.create(tournament=self.tournament, seq=1, draw_type=Round.DrawType.RANDOM)
+
+    def make_debate(self, teams, sides, result_status=Debate.STATUS_NONE):
+        debate = Debate.objects.create(round=self.round, result_status=result_status)
+        for team, side in zip(teams, sides):
+            DebateTeam.objects.create(debate=debate, team=team, side=side)
+        return debate
+
+    def assertIncomplete(self, stats, incomplete):  # noqa: N802
+        # As computed in BaseResultsEntryForRoundView
+        self.assertEqual(stats[Debate.STATUS_NONE] + stats[Debate.STATUS_DRAFT] > 0, incomplete)
+
+    def test_cleared_on_debate_save(self):
+        teams = list(Team.objects.all())
+        debate = self.make_debate(teams[0:2], [DebateSide.AFF, DebateSide.NEG], Debate.STATUS_DRAFT)
+        self.make_debate(teams[2:4], [DebateSide.AFF, DebateSide.NEG], Debate.STATUS_CONFIRMED)
+
+        stats = get_result_status_stats(self.round)
+        self.assertEqual(stats[Debate.STATUS_DRAFT], 1)
+        self.assertEqual(stats[Debate.STATUS_CONFIRMED], 1)
+        self.assertIncomplete(stats, True)
+
+        debate.result_status = Debate.STATUS_CONFIRMED
+        debate.save()
+
+        stats = get_result_status_stats(self.round)
+        self.assertEqual(stats[Debate.STATUS_DRAFT], 0)
+        self.assertEqual(stats[Debate.STATUS_CONFIRMED], 2)
+        self.assertIncomplete(stats, False)
+
+    def test_cleared_on_draw_creation(self):
+        activate_all(self.round)
+        stats = get_result_status_stats(self.round)
+        self.assertEqual(stats[Debate.STATUS_NONE], 0)
+        self.assertIncomplete(stats, False)
+
+        # Debates are bulk-created here, so this relies on the round being saved
+        DrawManager(self.round).create()
+
+        stats = get_result_status_stats(self.round)
+        self.assertEqual(stats[Debate.STATUS_NONE], 6)
+        self.assertIncomplete(stats, True)
+
+    def test_byes_excluded(self):
+        teams = list(Team.objects.all())
+        self.make_debate(teams[0:2], [DebateSide.AFF, DebateSide.NEG], Debate.STATUS_CONFIRMED)
+        self.make_debate(teams[2:3], [DebateSide.BYE])
+
+        stats = get_result_status_stats(self.round)
+        self.assertEqual(stats[Debate.STATUS_NONE], 0)
+        self.assertEqual(stats[Debate.STATUS_CONFIRMED], 1)
+        self.assertIncomplete(stats, False)
+
+
+class BaseVotingResultTestCase(test_result.VotingScoresMixin, test_result.BaseTestDebateResult):
+
+    debate_result_class = DebateResultByAdjudicatorWithScores
+    testdata = test_result.TestVotingDebateResultWithScores.testdata
+
+
+class TestReadableTeamscoresResult(BaseVotingResultTestCase):
+    """The dashboard reads two-team results off the team scores where it can;
+    these should read the same as those built from the full debate result."""
+
+    def get_ballotsub(self):
+        self.save_complete_result(self.testdata['high'])
+        return BallotSubmission.objects.get(debate=self.debate, confirmed=True)
+
+    def test_matches_full_result(self):
+        ballotsub = self.get_ballotsub()
+        expected = readable_ballotsub_result(DebateResult(ballotsub))
+
+        populate_teamscores([ballotsub])
+        self.assertEqual(readable_teamscores_result(ballotsub, self.tournament), expected)
+
+        serialized = ballotsub.serialize_like_actionlog
+        self.assertEqual((serialized['user'], serialized['type']), expected)
+
+    def test_falls_back_without_single_winner(self):
+        ballotsub = self.get_ballotsub()
+        TeamScore.objects.filter(ballot_submission=ballotsub).update(win=False)
+        with suppress_logs('results.result', logging.WARNING):
+            expected = readable_ballotsub_result(DebateResult(ballotsub))
+
+        populate_teamscores([ballotsub])
+        self.assertIsNone(readable_teamscores_result(ballotsub, self.tournament))
+
+        with suppress_logs('results.result', logging.WARNING):
+            serialized = ballotsub.serialize_like_actionlog
+        self.assertEqual((serialized['user'], serialized['type']), expected)
+
+
+class TestIdenticalBallotsubLists(BaseVotingResultTestCase):
+
+    def test_identical_versions(self):
+        for key in ['high', 'high', 'low', 'high', 'low']:
+            self.save_complete_result(self.testdata[key])
+
+        ballotsubs = list(self.debate.ballotsubmission_set.order_by('version'))
+        populate_identical_ballotsub_lists(ballotsubs)
+
+        self.assertEqual({b.version: b.identical_ballotsub_versions for b in ballotsubs}, {
+            1: [2, 4],
+            2: [1, 4],
+            3: [5],
+            4: [1, 2],
+            5: [3],
+        })
@@ -1,13 +1,50 @@
 from django.test import TestCase
 
-from utils.tests import ConditionalTableViewTestsMixin
+from adjallocation.models import DebateAdjudicator
+from results.models import BallotSubmission
+from tournaments.models import Round
+from utils.tests import CompletedTournamentTestMixin, ConditionalTableViewTestsMixin
 
 
 class PublicResultsForRoundViewTestCase(ConditionalTableViewTestsMixin, TestCase):
-
     view_toggle_preference = 'public_features__public_results'
     view_name = 'results-public-round'
     round_seq = 3
 
     def expected_row_counts(self):
         return [self.round.debate_set.count() * 2]
+
+
+class PublicNewBallotSetIndividualBallotsTestCase(CompletedTournamentTestMixin, TestCase):
+    view_name = 'old-results-public-ballotset-new-pk'
+    round_seq = 4
+
+    def setUp(self):
+        super().setUp()
+        self.tournament.preferences['data_entry__participant_ballots'] = 'public'
+        self.tournament.preferences['data_entry__individual_ballots'] = True
+        Round.objects.filter(pk=self.round.pk).update(draw_status=Round.Status.RELEASED, motions_released=True)
+
+        debateadj = DebateAdjudicator.objects.filter(
+            debate__round=self.round, type=DebateAdjudicator.TYPE_CHAIR).select_related('debate').first()
+        self.adjudicator = debateadj.adjudicator
+        other = self.tournament.adjudicator_set.exclude(pk=self.adjudicator.pk).first()
+
+        for submitter in [self.adjudicator, other, self.adjudicator]:
+            BallotSubmission.objects.create(debate=debateadj.debate, single_adj=True,
+                    submitter_type=BallotSubmission.Submitter.PUBLIC, participant_submitter=submitter)
+
+    def test_identical_versions_on_own_ballots(self):
+        response = self.get_response(self.view_name, adjudicator_pk=self.adjudicator.pk)
+        self.assertResponseOK(response)
+        self.assertIn('all_ballotsubs', response.context)
+
+        # The narrowed list is evaluated once, so the versions set on it by
+        # populate_identical_ballotsub_lists() reach the template
+        ballotsubs = list(response.context['all_ballotsubs'])
+        self.assertEqual(len(ballotsubs), 2)
+        versions = {ballotsub.version for ballotsub in ballotsubs}
+        for ballotsub in ballotsubs:
+            self.assertEqual(ballotsub.participant_submitter_id, self.adjudicator.pk)
+            self.assertTrue(hasattr(ballotsub, 'identical_ballotsub_versions'))
+            self.assertLessEqual(set(ballotsub.identical_ballotsub_versions), versions - {ballotsub.version})
@@ -1,48 +1,62 @@
 import logging
-from itertools import combinations
 
 from django.contrib.humanize.templatetags.humanize import ordinal
-from django.db.models import Count
+from django.core.cache import cache
+from django.db.models import Count, Q
 from django.utils.translation import gettext as _
-from django.utils.translation import gettext_lazy
+from django.utils.translation import gettext_lazy, gettext_noop
 
 from draw.models import Debate
+from draw.types import DebateSide
 from options.utils import use_team_code_names
 from tournaments.utils import get_side_name
 
 logger = logging.getLogger(__name__)
 
 
+# Built once rather than per debate; only the tooltip for the debate's status
+# is translated when it is looked up.
+STATUS_META = {
+    Debate.STATUS_NONE: ("x", "text-danger", 0, gettext_noop("No Ballot")),
+    Debate.STATUS_POSTPONED: ("pause", "", 4, gettext_noop("Debate was Postponed")),
+    Debate.STATUS_DRAFT: ("circle", "text-info", 2, gettext_noop("Ballot is Unconfirmed")),
+    Debate.STATUS_CONFIRMED: ("check", "text-success", 3, gettext_noop("Ballot is Confirmed")),
+}
+
+
 def get_status_meta(debate):
+    icon, css_class, sort, tooltip = STATUS_META[debate.result_status]
+    return icon, css_class, sort, _(tooltip)
+
+
+def _get_display_name(dt, t, use_codes):
     return {
-        Debate.STATUS_NONE: ("x", "text-danger", 0, _("No Ballot")),
-        Debate.STATUS_POSTPONED: ("pause", "", 4, _("Debate was Postponed")),
-        Debate.STATUS_DRAFT: ("circle", "text-info", 2, _("Ballot is Unconfirmed")),
-        Debate.STATUS_CONFIRMED: ("check", "text-success", 3, _("Ballot is Confirmed")),
-    }[debate.result_status]
+        'team': dt.team.code_name if use_codes else dt.team.short_name,
+        'side': dt.get_side_abbr(t),
+    }
+
+
+def _readable_two_team_result(winning_dt, losing_dt, t, use_codes):
+    result_winner = _("%(team)s (%(side)s) won") % _get_display_name(winning_dt, t, use_codes)
+    # Translators: The team here is the losing team
+    result = _("vs %(team)s (%(side)s)") % _get_display_name(losing_dt, t, use_codes)
+    return result_winner, result
 
 
 def readable_ballotsub_result(debateresult):
     """ Make a human-readable representation of a debate result """
 
-    def get_display_name(dt, t, use_codes):
-        return {
-            'team': dt.team.code_name if use_codes else dt.team.short_name,
-            'side': dt.get_side_abbr(t),
-        }
-
     def format_dt(dt, t, use_codes):
         # Translators: e.g. "{Melbourne 1} as {OG}", "{Cape Town 1} as {CO}"
-        return _("%(team)s as %(side)s") % get_display_name(dt, t, use_codes)
+        return _("%(team)s as %(side)s") % _get_display_name(dt, t, use_codes)
 
     t = debateresult.tournament
     use_codes = use_team_code_names(t, True)
 
     try:
         if t.pref('teams_in_debate') == 2:
-            result_winner = _("%(team)s (%(side)s) won") % get_display_name(debateresult.winning_dt(), t, use_codes)
-            # Translators: The team here is the losing team
-            result = _("vs %(team)s (%(side)s)") % get_display_name(debateresult.losing_dt(), t, use_codes)
+            result_winner, result = _readable_two_team_result(
+                debateresult.winning_dt(), debateresult.losing_dt(), t, use_codes)
         elif not debateresult.is_voting and debateresult.is_elimination:
             result_winner = _("Advancing: %(advancing_list)s<br>") % {
                 'advancing_list': ", ".join(format_dt(dt, t, use_codes) for dt in debateresult.advancing_dt()),
@@ -77,24 +91,49 @@ def readable_ballotsub_result(debateresult):
     return result_winner, result
 
 
+def readable_teamscores_result(ballotsub, t):
+    """Like readable_ballotsub_result(), but built from the `_teamscores`
+    attribute set by populate_teamscores(), so that the (much heavier) full
+    debate result doesn't need to be loaded. Only works for two-team debates;
+    returns None if the team scores don't show exactly one winner and one
+    loser, in which case the caller should fall back to the full result."""
+    winners = [ts.debate_team for ts in ballotsub._teamscores if ts.win]
+    losers = [ts.debate_team for ts in ballotsub._teamscores if not ts.win]
+    if len(winners) != 1 or len(losers) != 1:
+        return None
+    return _readable_two_team_result(winners[0], losers[0], t, use_team_code_names(t, True))
+
+
+RESULT_STATUS_STATS_CACHE_KEY = "%s_result_status_stats"
+# The stats are cleared by signals whenever they change, so this is only a
+# backstop for writes that bypass save(), like QuerySet.update(), and for
+# per-process caches (like the default LocMemCache) when there are several
+# workers, as signals only clear the cache of the worker that made the change
+RESULT_STATUS_STATS_CACHE_TIMEOUT = 60 * 1
+
+
 def get_result_status_stats(round):
     """Returns a dict where keys are result statuses of debates; values are the
-    number of debates in the round with that status.
+    number of debates in the round with that status. Bye debates, which
+    never have results entered, are excluded.
 
-    There is also an additional key 'B' that denotes those with ballots checked
-    in, but whose results are not entered."""
+    The stats are cached per round, and the cache is cleared whenever a debate
+    is saved or deleted, or the round is saved (see signals.py)."""
 
-    # query looks like: [{'result_status': 'C', 'result_status__count': 8}, ...]
-    query = round.debate_set.values('result_status').annotate(Count('result_status')).order_by()
+    key = RESULT_STATUS_STATS_CACHE_KEY % round.id
+    stats = cache.get(key)
+    if stats is None:
+        stats = _compute_result_status_stats(round)
+        cache.set(key, stats, RESULT_STATUS_STATS_CACHE_TIMEOUT)
+    return stats
 
-    # The query doesn't return zeroes where appropriate - for statuses with no
-    # debates, it just omits the item altogether. So initialize a dict:
-    choices = [code for code, name in Debate.STATUS_CHOICES]
-    stats = dict.fromkeys(choices, 0)
-    for item in query:
-        stats[item['result_status']] = item['result_status__count']
 
-    return stats
+def _compute_result_status_stats(round):
+    # Count each status with a filtered aggregate, so that statuses with no
+    # debates come back as zero, and the dict is built in a single query
+    choices = [code for code, name in Debate.STATUS_CHOICES]
+    return round.debate_set.exclude(debateteam__side=DebateSide.BYE).aggregate(**{
+        code: Count('id', filter=Q(result_status=code)) for code in choices})
 
 
 def populate_identical_ballotsub_lists(ballotsubs):
@@ -108,16 +147,22 @@ def populate_identical_ballotsub_lists(ballotsubs):
     from .prefetch import populate_results
     populate_results(ballotsubs)
 
+    # Being identical is an equivalence relation, so rather than compare every
+    # pair, sort the ballots into groups, comparing each only with the first
+    # member of each group found so far.
+    groups = []
     for ballotsub in ballotsubs:
-        ballotsub.identical_ballotsub_versions = []
-
-    for ballotsub1, ballotsub2 in combinations(ballotsubs, 2):
-        if ballotsub1.result.identical(ballotsub2.result):
-            ballotsub1.identical_ballotsub_versions.append(ballotsub2.version)
-            ballotsub2.identical_ballotsub_versions.append(ballotsub1.version)
+        for group in groups:
+            if group[0].result.identical(ballotsub.result):
+                group.append(ballotsub)
+                break
+        else:
+            groups.append([ballotsub])
 
-    for ballotsub in ballotsubs:
-        ballotsub.identical_ballotsub_versions.sort()
+    for group in groups:
+        versions = sorted(ballotsub.version for ballotsub in group)
+        for ballotsub in group:
+            ballotsub.identical_ballotsub_versions = [v for v in versions if v != ballotsub.version]
 
 
 _BP_POSITION_NAMES = [
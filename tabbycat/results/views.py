@@ -6,8 +6,8 @@ from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import ValidationError
 from django.db import ProgrammingError
-from django.db.models import Count, Max, Q, Window
-from django.db.models.functions import Coalesce, Rank
+from django.db.models import Count, Max, Prefetch, Q, Window
+from django.db.models.functions import Rank
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 from django.utils import timezone
@@ -45,7 +45,7 @@ from .models import BallotSubmission, ScoreCriterion, TeamScore
 from .prefetch import populate_confirmed_ballots, populate_results
 from .result import DebateResult, get_class_name
 from .tables import ResultsTableBuilder
-from .utils import get_status_meta, populate_identical_ballotsub_lists
+from .utils import get_result_status_stats, get_status_meta, populate_identical_ballotsub_lists
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +56,9 @@ class PublicResultsIndexView(PublicTournamentPageMixin, TemplateView):
     public_page_preference = 'public_results'
     cache_timeout = settings.PUBLIC_SLOW_CACHE_TIMEOUT
 
+    def get_cache_timeout(self):
+        return self.cache_timeout
+
     def get_context_data(self, **kwargs):
         kwargs["rounds"] = self.tournament.round_set.filter(
             completed=True, silent=False).order_by('seq')
@@ -83,10 +86,16 @@ class BaseResultsEntryForRoundView(RoundMixin, VueTableTemplateView):
         if self.tournament.pref('enable_postponements'):
             table.add_debate_postponement_column(draw)
         table.add_debate_venue_columns(draw, for_admin=True)
-        table.add_debate_results_columns(draw, iron=True, n_cols=self._get_draw().aggregate(n=Coalesce(Max('debateteam__side'), self.tournament.pref('teams_in_debate')-1))['n']+1)
+        table.add_debate_results_columns(draw, iron=True, n_cols=self._get_n_cols(draw))
         table.add_debate_adjudicators_column(draw, show_splits=True, for_admin=True)
         return table
 
+    def _get_n_cols(self, draw):
+        # The debate teams are prefetched, so find the number of sides from
+        # them rather than with another (aggregate) query
+        sides = [dt.side for debate in draw for dt in debate.debateteam_set.all()]
+        return max(sides, default=self.tournament.pref('teams_in_debate')-1) + 1
+
     def get_irons_list(self):
         iron_speeches = []
         use_code_names = use_team_code_names_data_entry(self.tournament, True)
@@ -102,8 +111,8 @@ class BaseResultsEntryForRoundView(RoundMixin, VueTableTemplateView):
         return iron_speeches
 
     def get_context_data(self, **kwargs):
-        kwargs["incomplete_ballots"] = self._get_draw().filter(
-            Q(result_status=Debate.STATUS_NONE) | Q(result_status=Debate.STATUS_DRAFT)).exists()
+        stats = get_result_status_stats(self.round)
+        kwargs["incomplete_ballots"] = stats[Debate.STATUS_NONE] + stats[Debate.STATUS_DRAFT] > 0
         kwargs["iron_speeches"] = self.get_irons_list()
         return super().get_context_data(**kwargs)
 
@@ -164,6 +173,9 @@ class PublicResultsForRoundView(RoundMixin, PublicTournamentPageMixin, VueTableT
     default_view = 'team'
     cache_timeout = settings.PUBLIC_SLOW_CACHE_TIMEOUT
 
+    def get_cache_timeout(self):
+        return self.cache_timeout
+
     def get_table(self):
         view_type = self.request.session.get('results_view', self.default_view)
         if view_type == 'debate':
@@ -194,17 +206,24 @@ class PublicResultsForRoundView(RoundMixin, PublicTournamentPageMixin, VueTableT
             debate_team__debate__round=self.round,
             ballot_submission__confirmed=True).prefetch_related(
             'debate_team__team__speaker_set',
-            'debate_team__debate__debateadjudicator_set__adjudicator',
-            'debate_team__debate__debateadjudicator_set__adjudicator__institution',
+            Prefetch('debate_team__debate__debateadjudicator_set',
+                queryset=DebateAdjudicator.objects.select_related('adjudicator__institution')),
             'debate_team__debate__debateteam_set__team').select_related(
             'ballot_submission',
             'debate_team__team__institution',
-            'debate_team__debate__round')
+            'debate_team__debate__round__tournament')
+
+        # Each team score comes with its own copy of its debate, so every debate
+        # appears once per team. Share one instance between the teams in each
+        # debate, so that the debates only need to be populated once.
+        debates_by_id = {}
+        for ts in teamscores:
+            ts.debate_team.debate = debates_by_id.setdefault(ts.debate_team.debate_id, ts.debate_team.debate)
         debates = [ts.debate_team.debate for ts in teamscores]
 
         if self.tournament.pref('teams_in_debate') == 2:
             populate_opponents([ts.debate_team for ts in teamscores])
-        populate_confirmed_ballots(debates, motions=True,
+        populate_confirmed_ballots(list(debates_by_id.values()), motions=True,
             results=self.round.ballots_per_debate == 'per-adj')
 
         table = TabbycatTableBuilder(view=self, sort_key="team")
@@ -296,10 +315,17 @@ class BaseBallotSetView(LogActionMixin, TournamentMixin, FormView):
 
         return super().get_context_data(**kwargs)
 
-    def get_all_ballotsubs(self):
+    def get_all_ballotsubs_queryset(self):
         all_ballotsubs = self.debate.ballotsubmission_set.order_by('version').select_related('submitter', 'confirmer', 'motion')
         if not self.request.user.is_superuser:
             all_ballotsubs = all_ballotsubs.exclude(discarded=True)
+        return all_ballotsubs
+
+    def get_all_ballotsubs(self):
+        # Populating the identical lists evaluates the query set, so subclasses
+        # should narrow it down in get_all_ballotsubs_queryset(), not here;
+        # otherwise the narrowed query set is fetched again without the lists.
+        all_ballotsubs = self.get_all_ballotsubs_queryset()
         populate_identical_ballotsub_lists(all_ballotsubs)
         return all_ballotsubs
 
@@ -638,8 +664,8 @@ class BasePublicNewBallotSetView(PersonalizablePublicTournamentPageMixin, RoundM
             using=self.template_engine,
         )
 
-    def get_all_ballotsubs(self):
-        q = super().get_all_ballotsubs()
+    def get_all_ballotsubs_queryset(self):
+        q = super().get_all_ballotsubs_queryset()
         if self.ballotsub.single_adj:
             return q.filter(participant_submitter=self.ballotsub.participant_submitter)
         return q
@@ -809,13 +835,19 @@ class AdjudicatorPrivateUrlBallotScoresheetView(RoundMixin, SingleObjectByRandom
     def is_page_enabled(self, tournament):
         return True
 
+    def get_latest_ballot(self):
+        # Both the permission check and the context need this, so only fetch it once
+        if not hasattr(self, '_latest_ballot'):
+            self._latest_ballot = self.object.ballotsubmission_set.filter(discarded=False).order_by('version').last()
+        return self._latest_ballot
+
     def check_permissions(self):
-        if not self.object.ballotsubmission_set.filter(discarded=False).exists():
+        if self.get_latest_ballot() is None:
             logger.warning("Refused public view of ballots for %s: no ballot", self.object)
             return 404, _("There is no result yet for debate %s.") % self.matchup_description()
 
     def get_context_data(self, **kwargs):
-        ballot = self.object.ballotsubmission_set.filter(discarded=False).order_by('version').last()
+        ballot = self.get_latest_ballot()
         kwargs['motion'] = ballot.motion
         kwargs['result'] = ballot.result
         kwargs['use_code_names'] = use_team_code_names(self.tournament, False)
@@ -867,10 +899,14 @@ class PublicBallotSubmissionIndexView(PublicTournamentPageMixin, RoundMixin, Vue
         if not self.is_draw_released():
             return None
 
+        # The table only shows adjudicators' (public) names and rooms, so
+        # don't load the rest of the adjudicator and debate fields
         debateadjs = DebateAdjudicator.objects.filter(
             debate__round=self.round,
         ).select_related(
             'adjudicator', 'debate__venue',
+        ).only(
+            'adjudicator__name', 'adjudicator__code_name', 'adjudicator__anonymous', 'debate__venue',
         ).prefetch_related(
             'debate__venue__venuecategory_set',
         ).order_by('adjudicator__name')
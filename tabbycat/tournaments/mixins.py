@@ -203,14 +203,15 @@ class RoundFromUrlMixin(TournamentFromUrlMixin):
         # then look in cache,
         seq = self.get_url_kwargs()[self.round_seq_url_kwarg]
         key = self.round_cache_key.format(slug=self.tournament.slug, seq=seq)
-        cached_round = cache.get(key)
-        if cached_round:
-            self._round_from_url = cached_round
-            return cached_round
-
-        # and if it was in neither place, retrieve the object
-        round = get_object_or_404(Round, tournament=self.tournament, seq=seq)
-        cache.set(key, round, None)
+        round = cache.get(key)
+        if not round:
+            # and if it was in neither place, retrieve the object
+            round = get_object_or_404(Round, tournament=self.tournament, seq=seq)
+            cache.set(key, round, None)
+
+        # Share our tournament instance, so that `round.tournament` (used by
+        # reverse_round(), roundurl etc.) doesn't fetch it all over again
+        round.tournament = self.tournament
         self._round_from_url = round
         return round
 
@@ -17,7 +17,7 @@ from actionlog.models import ActionLogEntry
 from draw.models import Debate
 from notifications.models import BulkNotification
 from results.models import BallotSubmission
-from results.prefetch import populate_confirmed_ballots
+from results.prefetch import populate_results, populate_teamscores
 from tournaments.models import Round
 from users.permissions import has_permission
 from utils.misc import redirect_round, redirect_tournament, reverse_round, reverse_tournament
@@ -87,11 +87,22 @@ class BaseTournamentDashboardHomeView(TournamentMixin, WarnAboutDatabaseUseMixin
 
         results_perm = has_permission(self.request.user, 'view.ballotsubmission', self.tournament)
         if results_perm:
-            debates = t.current_round.debate_set.filter(
-                ballotsubmission__confirmed=True,
-            ).order_by('-ballotsubmission__timestamp')[:updates]
-            populate_confirmed_ballots(debates, results=True)
-            subs = [d._confirmed_ballot.serialize_like_actionlog for d in debates]
+            # Fetch the confirmed ballots directly, rather than going through
+            # their debates, so that the ballots and their debates are loaded
+            # in a single query and the results are populated in bulk
+            ballotsubs = list(BallotSubmission.objects.filter(
+                debate__round=t.current_round, confirmed=True,
+            ).select_related('debate').order_by('-timestamp')[:updates])
+            for ballotsub in ballotsubs:
+                # They're all in the current round, so share it (and its
+                # tournament) rather than building copies for every ballot
+                ballotsub.debate.round = t.current_round
+            if t.pref('teams_in_debate') == 2:
+                # Two-team winners can be read off the saved team scores
+                populate_teamscores(ballotsubs)
+            else:
+                populate_results(ballotsubs, t)
+            subs = [b.serialize_like_actionlog for b in ballotsubs]
             kwargs["initialBallots"] = json.dumps(subs)
         else:
             kwargs["initialBallots"] = json.dumps([])
@@ -100,9 +111,12 @@ class BaseTournamentDashboardHomeView(TournamentMixin, WarnAboutDatabaseUseMixin
         kwargs["total_debates"] = t.current_round.debate_set.count()
         graph_perm = has_permission(self.request.user, 'view.ballotsubmission.graph', self.tournament)
         if (status == Round.Status.CONFIRMED or status == Round.Status.RELEASED) and graph_perm:
+            # Only load the fields that BallotSubmission.serialize() uses
             ballots = BallotSubmission.objects.filter(
                 debate__round=t.current_round, discarded=False).select_related(
-                'submitter', 'debate')
+                'submitter', 'participant_submitter').only(
+                'debate', 'timestamp', 'confirm_timestamp', 'confirmed', 'discarded', 'version',
+                'single_adj', 'ip_address', 'submitter', 'participant_submitter')
             stats = [{'ballot': bs.serialize(t)} for bs in ballots]
             kwargs["initial_graph_data"] = json.dumps(stats)
         else:
@@ -5,7 +5,6 @@ from typing import Optional, TYPE_CHECKING
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.db import connection
-from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django.views.generic.base import ContextMixin
 
@@ -160,10 +159,19 @@ class WarnAboutLegacySendgridConfigVarsMixin(ContextMixin):
 
 
 class CacheMixin:
-    """Mixin for views that cache the page and need to update quickly."""
+    """Mixin for views that cache the page and need to update quickly. Views
+    that can tolerate staler pages can override `get_cache_timeout()` to
+    cache for longer."""
 
     cache_timeout = settings.PUBLIC_FAST_CACHE_TIMEOUT
 
-    @method_decorator(cache_page(cache_timeout))
+    def get_cache_timeout(self):
+        # Views' `cache_timeout` attributes weren't honoured before this hook
+        # existed, and pages like the tabs aren't invalidated when results
+        # change, so only views that override this method cache for longer.
+        return CacheMixin.cache_timeout
+
     def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
+        # Decorate here rather than with @method_decorator, so that the timeout
+        # can be chosen per view
+        return cache_page(self.get_cache_timeout())(super().dispatch)(*args, **kwargs)